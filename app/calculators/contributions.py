@@ -21,12 +21,13 @@ class ContributionCalculator:
     def __init__(self, year: int = 2024):
         self.year = year
         self.limits = CONTRIBUTION_LIMITS.get(year, CONTRIBUTION_LIMITS[2024])
+        # Resolve the limits once rather than with string-keyed lookups per call
+        self._base = self.limits["base"]
+        self._catchup = self.limits["catchup"]
+        self._catchup_age = self.limits["catchup_age"]
 
     def get_max_contribution(self, age: int) -> float:
-        base = self.limits["base"]
-        if age >= self.limits["catchup_age"]:
-            return base + self.limits["catchup"]
-        return base
+        return self._base + (self._catchup if age >= self._catchup_age else 0)
 
     def calculate_contribution(
         self,
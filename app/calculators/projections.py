@@ -1,9 +1,18 @@
+import functools
+import math
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from typing import Literal
 
+# Candidate Traditional percentages for find_optimal_split: 0% to 100% in 5% steps
+SPLIT_GRID = tuple(range(0, 101, 5))
+# The same grid as fractions of the employee contribution
+SPLIT_FRACTIONS = tuple(split / 100 for split in SPLIT_GRID)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class YearlyProjection:
+    """One year of a projection. Values are unrounded; round when presenting them."""
     year: int
     age: int
     contribution: float
@@ -17,10 +26,72 @@ class YearlyProjection:
     roth_balance: float = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ProjectionSeries(Sequence[YearlyProjection]):
+    """Year-by-year projection values stored column-wise, one tuple per field.
+
+    Behaves as a read-only sequence of YearlyProjection, building each row
+    only when it is accessed. Like YearlyProjection, values are unrounded.
+    """
+    year: tuple[int, ...]
+    age: tuple[int, ...]
+    contribution: tuple[float, ...]
+    employer_match: tuple[float, ...]
+    growth: tuple[float, ...]
+    balance: tuple[float, ...]
+    taxable_balance: tuple[float, ...]
+    total_wealth: tuple[float, ...]
+    after_tax_wealth: tuple[float, ...]
+    traditional_balance: tuple[float, ...]
+    roth_balance: tuple[float, ...]
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    def __getitem__(self, index: int | slice) -> YearlyProjection | list[YearlyProjection]:
+        """Build the YearlyProjection for one year, or a list of them for a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        return YearlyProjection(
+            self.year[index],
+            self.age[index],
+            self.contribution[index],
+            self.employer_match[index],
+            self.growth[index],
+            self.balance[index],
+            self.taxable_balance[index],
+            self.total_wealth[index],
+            self.after_tax_wealth[index],
+            self.traditional_balance[index],
+            self.roth_balance[index],
+        )
+
+    def __iter__(self) -> Iterator[YearlyProjection]:
+        # Fields in declaration order
+        for row in zip(
+            self.year,
+            self.age,
+            self.contribution,
+            self.employer_match,
+            self.growth,
+            self.balance,
+            self.taxable_balance,
+            self.total_wealth,
+            self.after_tax_wealth,
+            self.traditional_balance,
+            self.roth_balance,
+        ):
+            yield YearlyProjection(*row)
+
+    def to_yearly_list(self) -> list[YearlyProjection]:
+        """Materialize one YearlyProjection per year."""
+        return list(self)
+
+
+@dataclass(slots=True, frozen=True)
 class SplitProjectionResult:
     """Result for a specific Traditional/Roth split"""
-    projections: list[YearlyProjection]
+    series: ProjectionSeries
     traditional_balance: float
     roth_balance: float
     taxable_balance: float
@@ -32,11 +103,16 @@ class SplitProjectionResult:
     split_percent: float  # % Traditional
     actual_mega_backdoor: float  # Capped at take_home
 
+    # Read-only sequence that builds each YearlyProjection only when accessed
+    @property
+    def projections(self) -> ProjectionSeries:
+        return self.series
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectionResult:
-    traditional_projections: list[YearlyProjection]
-    roth_projections: list[YearlyProjection]
+    traditional_series: ProjectionSeries
+    roth_series: ProjectionSeries
     traditional_final_balance: float
     roth_final_balance: float
     traditional_after_tax: float
@@ -50,6 +126,77 @@ class ProjectionResult:
     total_growth_traditional: float
     total_growth_roth: float
 
+    # Read-only sequences that build each YearlyProjection only when accessed
+    @property
+    def traditional_projections(self) -> ProjectionSeries:
+        return self.traditional_series
+
+    @property
+    def roth_projections(self) -> ProjectionSeries:
+        return self.roth_series
+
+
+def _compound_series(
+    balance: float, contribution_fv: float, growth_factor: float, years: int
+) -> list[float]:
+    """Year-end balances of balance = balance * growth_factor + contribution_fv."""
+    balances = [0.0] * years
+    if balance == 0 and contribution_fv == 0:
+        # Unused account (e.g. no mega backdoor): stays at zero
+        return balances
+    for i in range(years):
+        balance = balance * growth_factor + contribution_fv
+        balances[i] = balance
+    return balances
+
+
+def _grow_split_balances(
+    years: int,
+    traditional_balance: float,
+    roth_balance: float,
+    mega_backdoor_balance: float,
+    taxable_balance: float,
+    trad_contrib_fv: float,
+    roth_contrib_fv: float,
+    mega_backdoor_fv: float,
+    taxable_savings_fv: float,
+    growth_factor: float,
+    taxable_growth_factor: float,
+) -> tuple[list[float], list[float], list[float], list[float]]:
+    """Year-end balances of the Traditional, Roth, mega backdoor and taxable accounts.
+
+    Scalar-only recurrence kept apart from the result building so the
+    loop body touches nothing but locals.
+    """
+    trad_balances = [0.0] * years
+    roth_balances = [0.0] * years
+    mega_backdoor_balances = [0.0] * years
+    taxable_balances = [0.0] * years
+    for i in range(years):
+        traditional_balance = traditional_balance * growth_factor + trad_contrib_fv
+        roth_balance = roth_balance * growth_factor + roth_contrib_fv
+        mega_backdoor_balance = mega_backdoor_balance * growth_factor + mega_backdoor_fv
+        taxable_balance = taxable_balance * taxable_growth_factor + taxable_savings_fv
+        trad_balances[i] = traditional_balance
+        roth_balances[i] = roth_balance
+        mega_backdoor_balances[i] = mega_backdoor_balance
+        taxable_balances[i] = taxable_balance
+    return trad_balances, roth_balances, mega_backdoor_balances, taxable_balances
+
+
+def _compound_final(
+    balance: float, contribution_fv: float, growth_factor: float, years: int
+) -> float:
+    """Balance after `years` of balance = balance * growth_factor + contribution_fv.
+
+    Closed form of the linear recurrence:
+    B_n = B_0 * g**n + c * (g**n - 1) / (g - 1).
+    """
+    if growth_factor == 1:
+        return balance + contribution_fv * years
+    compounded = growth_factor**years
+    return balance * compounded + contribution_fv * (compounded - 1) / (growth_factor - 1)
+
 
 class ProjectionCalculator:
     def __init__(
@@ -67,36 +214,29 @@ class ProjectionCalculator:
         self.capital_gains_rate = capital_gains_rate
         self.savings_rate = savings_rate
         self.dividend_yield = dividend_yield
-
-    def _calculate_year_growth(
-        self, starting_balance: float, contribution: float, return_rate: float = None
-    ) -> tuple[float, float]:
-        r = return_rate if return_rate is not None else self.annual_return
-
+        # Every timing mode grows a year as
+        #   ending = starting * growth_factor + contribution * contribution_factor
+        # so resolve both factors once per return rate instead of once per call
+        self._growth_factor, self._contribution_factor = self._year_factors(annual_return)
+        taxable_growth_factor, self._taxable_contribution_factor = self._year_factors(taxable_return)
+        # Dividends are taxed every year on the balance held at the start of the
+        # year, which is the same as shaving the drag off the growth factor
+        self._taxable_growth_factor = taxable_growth_factor - dividend_yield * capital_gains_rate
+
+    def _year_factors(self, r: float) -> tuple[float, float]:
+        """Return (balance growth factor, contribution multiplier) for one year at rate r."""
         if self.contribution_timing == "beginning":
-            total = starting_balance + contribution
-            ending = total * (1 + r)
-            growth = ending - starting_balance - contribution
-        elif self.contribution_timing == "end":
-            ending = starting_balance * (1 + r) + contribution
-            growth = starting_balance * r
-        else:
-            balance_growth = starting_balance * (1 + r)
-            monthly_contribution = contribution / 12
-            monthly_rate = (1 + r) ** (1 / 12) - 1
-            contribution_fv = 0
-            for month in range(12):
-                months_to_grow = 12 - month - 1
-                contribution_fv += monthly_contribution * (
-                    (1 + monthly_rate) ** months_to_grow
-                )
-            ending = balance_growth + contribution_fv
-            growth = ending - starting_balance - contribution
-
-        return round(ending, 2), round(growth, 2)
-
-    def _apply_dividend_tax(self, balance: float) -> float:
-        return balance * self.dividend_yield * self.capital_gains_rate
+            return 1 + r, 1 + r
+        if self.contribution_timing == "end":
+            return 1 + r, 1
+        # Future value of 12 end-of-month deposits of contribution / 12. Since
+        # (1 + monthly_rate)**12 equals 1 + r, the annuity sum
+        # ((1 + mr)**12 - 1) / mr reduces to r / mr. expm1/log1p keep the
+        # monthly rate accurate for small r, where (1 + r)**(1/12) - 1 cancels.
+        monthly_rate = math.expm1(math.log1p(r) / 12)
+        if monthly_rate:
+            return 1 + r, r / monthly_rate / 12
+        return 1 + r, 1
 
     def calculate_projections(
         self,
@@ -111,23 +251,44 @@ class ProjectionCalculator:
         initial_taxable_balance: float = 0,
         mega_backdoor_contribution: float = 0,
     ) -> ProjectionResult:
-        years = retirement_age - current_age
+        """Project 100% Traditional and 100% Roth side by side.
 
-        traditional_projections = []
-        roth_projections = []
-
-        trad_401k_balance = initial_401k_balance
-        roth_401k_balance = initial_401k_balance
-        trad_taxable_balance = initial_taxable_balance
-        roth_taxable_balance = initial_taxable_balance
-        trad_taxable_contributions = initial_taxable_balance
-        roth_taxable_contributions = initial_taxable_balance
-        trad_mega_backdoor_balance = 0.0
-        roth_mega_backdoor_balance = 0.0
-        total_contributions = 0.0
-        total_employer_match = 0.0
-        total_growth_trad = 0.0
-        total_growth_roth = 0.0
+        Results are memoized on the calculator settings and the arguments, so
+        identical calls share one (immutable) ProjectionResult.
+        """
+        return _calculate_projections_cached(
+            self.annual_return,
+            self.taxable_return,
+            self.contribution_timing,
+            self.capital_gains_rate,
+            self.savings_rate,
+            self.dividend_yield,
+            current_age,
+            retirement_age,
+            annual_contribution,
+            employer_match,
+            retirement_tax_rate,
+            trad_take_home,
+            roth_take_home,
+            initial_401k_balance,
+            initial_taxable_balance,
+            mega_backdoor_contribution,
+        )
+
+    def _calculate_projections(
+        self,
+        current_age: int,
+        retirement_age: int,
+        annual_contribution: float,
+        employer_match: float,
+        retirement_tax_rate: float,
+        trad_take_home: float,
+        roth_take_home: float,
+        initial_401k_balance: float,
+        initial_taxable_balance: float,
+        mega_backdoor_contribution: float,
+    ) -> ProjectionResult:
+        years = retirement_age - current_age
 
         # Cap mega backdoor at take_home
         trad_mega_backdoor = min(mega_backdoor_contribution, trad_take_home)
@@ -140,91 +301,113 @@ class ProjectionCalculator:
         trad_annual_savings = max(0, trad_spending_money * self.savings_rate)
         roth_annual_savings = max(0, roth_spending_money * self.savings_rate)
 
-        for i in range(years):
-            year = i + 1
-            age = current_age + year
-
-            total_trad_contrib = annual_contribution + employer_match
-
-            trad_401k_balance, trad_growth = self._calculate_year_growth(
-                trad_401k_balance, total_trad_contrib
-            )
-            roth_401k_balance, roth_growth = self._calculate_year_growth(
-                roth_401k_balance, total_trad_contrib
-            )
-
-            # Mega backdoor grows tax-free (same rate as 401k), capped at take_home
-            trad_mega_backdoor_balance, _ = self._calculate_year_growth(
-                trad_mega_backdoor_balance, trad_mega_backdoor
-            )
-            roth_mega_backdoor_balance, _ = self._calculate_year_growth(
-                roth_mega_backdoor_balance, roth_mega_backdoor
-            )
-
-            trad_div_tax = self._apply_dividend_tax(trad_taxable_balance)
-            trad_taxable_balance, _ = self._calculate_year_growth(
-                trad_taxable_balance, trad_annual_savings, self.taxable_return
-            )
-            trad_taxable_balance -= trad_div_tax
-            trad_taxable_contributions += trad_annual_savings
+        growth_factor = self._growth_factor
+        taxable_growth_factor = self._taxable_growth_factor
+        total_trad_contrib = annual_contribution + employer_match
+        trad_contrib_fv = total_trad_contrib * self._contribution_factor
+        trad_mega_backdoor_fv = trad_mega_backdoor * self._contribution_factor
+        roth_mega_backdoor_fv = roth_mega_backdoor * self._contribution_factor
+        trad_savings_fv = trad_annual_savings * self._taxable_contribution_factor
+        roth_savings_fv = roth_annual_savings * self._taxable_contribution_factor
+
+        # Both paths put the same dollars into the 401(k) (the comparison is in
+        # how they are taxed), so one balance series serves both
+        balances_401k = _compound_series(initial_401k_balance, trad_contrib_fv, growth_factor, years)
+        # Mega backdoor grows tax-free (same rate as 401k), capped at take_home
+        trad_mega_backdoor_balances = _compound_series(0.0, trad_mega_backdoor_fv, growth_factor, years)
+        if roth_mega_backdoor == trad_mega_backdoor:
+            # Cap only differs when a take-home is below the mega backdoor amount
+            roth_mega_backdoor_balances = trad_mega_backdoor_balances
+        else:
+            roth_mega_backdoor_balances = _compound_series(0.0, roth_mega_backdoor_fv, growth_factor, years)
+        trad_taxable_balances = _compound_series(
+            initial_taxable_balance, trad_savings_fv, taxable_growth_factor, years
+        )
+        roth_taxable_balances = _compound_series(
+            initial_taxable_balance, roth_savings_fv, taxable_growth_factor, years
+        )
+        growths_401k = tuple(
+            balance - previous_balance - total_trad_contrib
+            for previous_balance, balance in zip([initial_401k_balance] + balances_401k, balances_401k)
+        )
 
-            roth_div_tax = self._apply_dividend_tax(roth_taxable_balance)
-            roth_taxable_balance, _ = self._calculate_year_growth(
-                roth_taxable_balance, roth_annual_savings, self.taxable_return
-            )
-            roth_taxable_balance -= roth_div_tax
-            roth_taxable_contributions += roth_annual_savings
-
-            trad_total_wealth = trad_401k_balance + trad_taxable_balance + trad_mega_backdoor_balance
-            roth_total_wealth = roth_401k_balance + roth_taxable_balance + roth_mega_backdoor_balance
-
-            traditional_projections.append(
-                YearlyProjection(
-                    year=year,
-                    age=age,
-                    contribution=annual_contribution,
-                    employer_match=employer_match,
-                    growth=trad_growth,
-                    balance=trad_401k_balance,
-                    taxable_balance=round(trad_taxable_balance, 2),
-                    total_wealth=round(trad_total_wealth, 2),
+        # Series columns are immutable tuples, so the two plans can share the
+        # columns they have in common and cached results cannot be corrupted
+        year_numbers = tuple(range(1, years + 1))
+        ages = tuple(range(current_age + 1, current_age + years + 1))
+        contributions = (annual_contribution,) * years
+        employer_matches = (employer_match,) * years
+        balances_401k = tuple(balances_401k)
+        # Neither path tracks after-tax wealth or a Traditional/Roth breakdown per year
+        zeros = (0,) * years
+        traditional_series = ProjectionSeries(
+            year=year_numbers,
+            age=ages,
+            contribution=contributions,
+            employer_match=employer_matches,
+            growth=growths_401k,
+            balance=balances_401k,
+            taxable_balance=tuple(trad_taxable_balances),
+            total_wealth=tuple(
+                balance + taxable_balance + mega_backdoor_balance
+                for balance, taxable_balance, mega_backdoor_balance in zip(
+                    balances_401k, trad_taxable_balances, trad_mega_backdoor_balances
                 )
-            )
-
-            roth_projections.append(
-                YearlyProjection(
-                    year=year,
-                    age=age,
-                    contribution=annual_contribution,
-                    employer_match=employer_match,
-                    growth=roth_growth,
-                    balance=roth_401k_balance,
-                    taxable_balance=round(roth_taxable_balance, 2),
-                    total_wealth=round(roth_total_wealth, 2),
+            ),
+            after_tax_wealth=zeros,
+            traditional_balance=zeros,
+            roth_balance=zeros,
+        )
+        roth_series = ProjectionSeries(
+            year=year_numbers,
+            age=ages,
+            contribution=contributions,
+            employer_match=employer_matches,
+            growth=growths_401k,
+            balance=balances_401k,
+            taxable_balance=tuple(roth_taxable_balances),
+            total_wealth=tuple(
+                balance + taxable_balance + mega_backdoor_balance
+                for balance, taxable_balance, mega_backdoor_balance in zip(
+                    balances_401k, roth_taxable_balances, roth_mega_backdoor_balances
                 )
-            )
+            ),
+            after_tax_wealth=zeros,
+            traditional_balance=zeros,
+            roth_balance=zeros,
+        )
 
-            total_contributions += annual_contribution
-            total_employer_match += employer_match
-            total_growth_trad += trad_growth
-            total_growth_roth += roth_growth
+        # Final values straight from the closed form rather than the series
+        shared_401k_balance = _compound_final(initial_401k_balance, trad_contrib_fv, growth_factor, years)
+        trad_mega_backdoor_balance = _compound_final(0.0, trad_mega_backdoor_fv, growth_factor, years)
+        roth_mega_backdoor_balance = _compound_final(0.0, roth_mega_backdoor_fv, growth_factor, years)
+        trad_taxable_balance = _compound_final(
+            initial_taxable_balance, trad_savings_fv, taxable_growth_factor, years
+        )
+        roth_taxable_balance = _compound_final(
+            initial_taxable_balance, roth_savings_fv, taxable_growth_factor, years
+        )
+        total_contributions = annual_contribution * years
+        total_employer_match = employer_match * years
+        total_growth_401k = shared_401k_balance - initial_401k_balance - total_trad_contrib * years
 
-        trad_401k_after_tax = trad_401k_balance * (1 - retirement_tax_rate)
-        trad_taxable_gains = trad_taxable_balance - trad_taxable_contributions
+        trad_401k_after_tax = shared_401k_balance * (1 - retirement_tax_rate)
+        # Cost basis is the starting balance plus a constant savings deposit per year
+        trad_taxable_gains = trad_taxable_balance - initial_taxable_balance - trad_annual_savings * years
         trad_taxable_after_tax = trad_taxable_balance - (trad_taxable_gains * self.capital_gains_rate)
         # Mega backdoor is tax-free at withdrawal (like Roth)
         trad_total_after_tax = trad_401k_after_tax + trad_taxable_after_tax + trad_mega_backdoor_balance
 
-        roth_taxable_gains = roth_taxable_balance - roth_taxable_contributions
+        roth_taxable_gains = roth_taxable_balance - initial_taxable_balance - roth_annual_savings * years
         roth_taxable_after_tax = roth_taxable_balance - (roth_taxable_gains * self.capital_gains_rate)
         # Mega backdoor is tax-free at withdrawal
-        roth_total_after_tax = roth_401k_balance + roth_taxable_after_tax + roth_mega_backdoor_balance
+        roth_total_after_tax = shared_401k_balance + roth_taxable_after_tax + roth_mega_backdoor_balance
 
         return ProjectionResult(
-            traditional_projections=traditional_projections,
-            roth_projections=roth_projections,
-            traditional_final_balance=round(trad_401k_balance, 2),
-            roth_final_balance=round(roth_401k_balance, 2),
+            traditional_series=traditional_series,
+            roth_series=roth_series,
+            traditional_final_balance=round(shared_401k_balance, 2),
+            roth_final_balance=round(shared_401k_balance, 2),
             traditional_after_tax=round(trad_total_after_tax, 2),
             roth_after_tax=round(roth_total_after_tax, 2),
             traditional_taxable_balance=round(trad_taxable_balance, 2),
@@ -233,8 +416,8 @@ class ProjectionCalculator:
             roth_mega_backdoor_balance=round(roth_mega_backdoor_balance, 2),
             total_contributions=round(total_contributions, 2),
             total_employer_match=round(total_employer_match, 2),
-            total_growth_traditional=round(total_growth_trad, 2),
-            total_growth_roth=round(total_growth_roth, 2),
+            total_growth_traditional=round(total_growth_401k, 2),
+            total_growth_roth=round(total_growth_401k, 2),
         )
 
     def calculate_split_projection(
@@ -254,8 +437,6 @@ class ProjectionCalculator:
         years = retirement_age - current_age
         split_ratio = traditional_split / 100
 
-        projections = []
-
         # Split the contribution between Traditional and Roth
         traditional_contrib = annual_contribution * split_ratio
         roth_contrib = annual_contribution * (1 - split_ratio)
@@ -264,13 +445,8 @@ class ProjectionCalculator:
         traditional_balance = initial_401k_balance * split_ratio
         roth_balance = initial_401k_balance * (1 - split_ratio)
         taxable_balance = initial_taxable_balance
-        taxable_contributions = initial_taxable_balance
         mega_backdoor_balance = 0.0
 
-        total_contributions = 0.0
-        total_employer_match_sum = 0.0
-        total_growth = 0.0
-
         # Cap mega backdoor at take_home
         actual_mega_backdoor = min(mega_backdoor_contribution, take_home)
 
@@ -278,70 +454,83 @@ class ProjectionCalculator:
         spending_money = take_home - actual_mega_backdoor
         annual_taxable_savings = max(0, spending_money * self.savings_rate)
 
-        for i in range(years):
-            year = i + 1
-            age = current_age + year
-
-            # Both Traditional and Roth get employer match (always Traditional)
-            total_401k_contrib = annual_contribution + employer_match
+        # Loop invariants: growth factors (the taxable one net of dividend drag),
+        # per-year contribution future values and the retirement tax haircut
+        growth_factor = self._growth_factor
+        taxable_growth_factor = self._taxable_growth_factor
+        capital_gains_rate = self.capital_gains_rate
+        after_tax_factor = 1 - retirement_tax_rate
+        # Employer match always goes to Traditional
+        trad_total_contrib = traditional_contrib + employer_match
+        trad_contrib_fv = trad_total_contrib * self._contribution_factor
+        roth_contrib_fv = roth_contrib * self._contribution_factor
+        mega_backdoor_fv = actual_mega_backdoor * self._contribution_factor
+        taxable_savings_fv = annual_taxable_savings * self._taxable_contribution_factor
+
+        trad_balances, roth_balances, mega_backdoor_balances, taxable_balances = _grow_split_balances(
+            years,
+            traditional_balance,
+            roth_balance,
+            mega_backdoor_balance,
+            taxable_balance,
+            trad_contrib_fv,
+            roth_contrib_fv,
+            mega_backdoor_fv,
+            taxable_savings_fv,
+            growth_factor,
+            taxable_growth_factor,
+        )
 
-            # Grow Traditional balance
+        growths = [0.0] * years
+        total_balances = [0.0] * years
+        total_wealths = [0.0] * years
+        after_tax_wealths = [0.0] * years
+
+        initial_traditional_balance = traditional_balance
+        initial_roth_balance = roth_balance
+        old_trad = traditional_balance
+        old_roth = roth_balance
+        for i, (traditional_balance, roth_balance, mega_backdoor_balance, taxable_balance) in enumerate(
+            zip(trad_balances, roth_balances, mega_backdoor_balances, taxable_balances)
+        ):
+            trad_growth = traditional_balance - old_trad - trad_total_contrib
+            roth_growth = roth_balance - old_roth - roth_contrib
+            combined_growth = trad_growth + roth_growth
             old_trad = traditional_balance
-            traditional_balance, trad_growth = self._calculate_year_growth(
-                traditional_balance, traditional_contrib + employer_match
-            )
-
-            # Grow Roth balance
             old_roth = roth_balance
-            roth_balance, roth_growth = self._calculate_year_growth(
-                roth_balance, roth_contrib
-            )
 
-            combined_growth = trad_growth + roth_growth
-
-            # Mega backdoor grows tax-free (capped at take_home)
-            mega_backdoor_balance, _ = self._calculate_year_growth(
-                mega_backdoor_balance, actual_mega_backdoor
-            )
-
-            # Taxable account with dividend drag
-            div_tax = self._apply_dividend_tax(taxable_balance)
-            taxable_balance, _ = self._calculate_year_growth(
-                taxable_balance, annual_taxable_savings, self.taxable_return
-            )
-            taxable_balance -= div_tax
-            taxable_contributions += annual_taxable_savings
+            # Cost basis: starting balance plus a constant savings deposit per year
+            taxable_contributions = initial_taxable_balance + annual_taxable_savings * (i + 1)
 
             total_balance = traditional_balance + roth_balance
             total_wealth = total_balance + taxable_balance + mega_backdoor_balance
 
             # Calculate after-tax wealth for this year
-            trad_after_tax = traditional_balance * (1 - retirement_tax_rate)
+            trad_after_tax = traditional_balance * after_tax_factor
             roth_after_tax = roth_balance  # Tax-free
             taxable_gains = taxable_balance - taxable_contributions
-            taxable_after_tax = taxable_balance - (taxable_gains * self.capital_gains_rate)
+            taxable_after_tax = taxable_balance - (taxable_gains * capital_gains_rate)
             mega_after_tax = mega_backdoor_balance  # Tax-free
             after_tax_wealth = trad_after_tax + roth_after_tax + taxable_after_tax + mega_after_tax
 
-            projections.append(
-                YearlyProjection(
-                    year=year,
-                    age=age,
-                    contribution=annual_contribution,
-                    employer_match=employer_match,
-                    growth=combined_growth,
-                    balance=round(total_balance, 2),
-                    taxable_balance=round(taxable_balance, 2),
-                    total_wealth=round(total_wealth, 2),
-                    after_tax_wealth=round(after_tax_wealth, 2),
-                    traditional_balance=round(traditional_balance, 2),
-                    roth_balance=round(roth_balance, 2),
-                )
-            )
-
-            total_contributions += annual_contribution
-            total_employer_match_sum += employer_match
-            total_growth += combined_growth
+            growths[i] = combined_growth
+            total_balances[i] = total_balance
+            total_wealths[i] = total_wealth
+            after_tax_wealths[i] = after_tax_wealth
+
+        series = ProjectionSeries(
+            year=tuple(range(1, years + 1)),
+            age=tuple(range(current_age + 1, current_age + years + 1)),
+            contribution=(annual_contribution,) * years,
+            employer_match=(employer_match,) * years,
+            growth=tuple(growths),
+            balance=tuple(total_balances),
+            taxable_balance=tuple(taxable_balances),
+            total_wealth=tuple(total_wealths),
+            after_tax_wealth=tuple(after_tax_wealths),
+            traditional_balance=tuple(trad_balances),
+            roth_balance=tuple(roth_balances),
+        )
 
         # Calculate after-tax values
         # Traditional portion is taxed at retirement rate
@@ -349,20 +538,28 @@ class ProjectionCalculator:
         # Roth portion is tax-free
         roth_after_tax = roth_balance
         # Taxable: only gains are taxed
-        taxable_gains = taxable_balance - taxable_contributions
+        taxable_gains = taxable_balance - initial_taxable_balance - annual_taxable_savings * years
         taxable_after_tax = taxable_balance - (taxable_gains * self.capital_gains_rate)
         # Mega backdoor is tax-free
         total_after_tax = traditional_after_tax + roth_after_tax + taxable_after_tax + mega_backdoor_balance
 
+        # Totals in closed form; yearly growth telescopes to final - initial - deposits
+        total_contributions = annual_contribution * years
+        total_employer_match = employer_match * years
+        total_growth = (
+            traditional_balance - initial_traditional_balance - trad_total_contrib * years
+            + roth_balance - initial_roth_balance - roth_contrib * years
+        )
+
         return SplitProjectionResult(
-            projections=projections,
+            series=series,
             traditional_balance=round(traditional_balance, 2),
             roth_balance=round(roth_balance, 2),
             taxable_balance=round(taxable_balance, 2),
             mega_backdoor_balance=round(mega_backdoor_balance, 2),
             after_tax_total=round(total_after_tax, 2),
             total_contributions=round(total_contributions, 2),
-            total_employer_match=round(total_employer_match_sum, 2),
+            total_employer_match=round(total_employer_match, 2),
             total_growth=round(total_growth, 2),
             split_percent=traditional_split,
             actual_mega_backdoor=round(actual_mega_backdoor, 2),
@@ -375,35 +572,254 @@ class ProjectionCalculator:
         annual_contribution: float,
         employer_match: float,
         retirement_tax_rate: float,
-        take_home_at_split: callable,  # Function that returns take-home for a given split
+        take_homes: tuple[float, ...],  # Take-home pay at each split in SPLIT_GRID
         initial_401k_balance: float = 0,
         initial_taxable_balance: float = 0,
         mega_backdoor_contribution: float = 0,
     ) -> tuple[float, float]:
         """Find the optimal Traditional/Roth split that maximizes after-tax value.
 
+        Results are memoized on the calculator settings and the arguments, so
+        repeated requests with the same inputs skip the sweep entirely.
+
         Returns (optimal_split_percent, optimal_after_tax_value)
         """
-        best_split = 0
-        best_value = 0
-
-        # Test splits from 0% to 100% Traditional in 5% increments
-        for split in range(0, 101, 5):
-            take_home = take_home_at_split(split)
-            result = self.calculate_split_projection(
-                current_age=current_age,
-                retirement_age=retirement_age,
-                annual_contribution=annual_contribution,
-                employer_match=employer_match,
-                retirement_tax_rate=retirement_tax_rate,
-                take_home=take_home,
-                initial_401k_balance=initial_401k_balance,
-                initial_taxable_balance=initial_taxable_balance,
-                mega_backdoor_contribution=mega_backdoor_contribution,
-                traditional_split=split,
+        if len(take_homes) != len(SPLIT_GRID):
+            raise ValueError(f"take_homes must have one entry per split in SPLIT_GRID ({len(SPLIT_GRID)})")
+        return _find_optimal_split_cached(
+            self.annual_return,
+            self.taxable_return,
+            self.contribution_timing,
+            self.capital_gains_rate,
+            self.savings_rate,
+            self.dividend_yield,
+            current_age,
+            retirement_age,
+            annual_contribution,
+            employer_match,
+            retirement_tax_rate,
+            tuple(take_homes),
+            initial_401k_balance,
+            initial_taxable_balance,
+            mega_backdoor_contribution,
+        )
+
+    def calculate_split_projection_many(
+        self,
+        current_age: int,
+        retirement_age: int,
+        annual_contribution: float,
+        employer_match: float,
+        retirement_tax_rate: float,
+        splits: Sequence[float],  # % going to Traditional, one entry per scenario
+        take_homes: Sequence[float],  # Take-home pay at the matching split
+        initial_401k_balance: float = 0,
+        initial_taxable_balance: float = 0,
+        mega_backdoor_contribution: float = 0,
+    ) -> dict[str, list[float]]:
+        """Final balances and after-tax totals for several splits in one pass.
+
+        Only final values are produced, so each account uses the closed form
+        of its yearly recurrence instead of walking the years, and no yearly
+        projections are built. Each list in the result is aligned with
+        `splits`; values match the same fields of calculate_split_projection.
+        Raises ValueError if `take_homes` is not the same length as `splits`.
+        """
+        years = retirement_age - current_age
+        columns = ([], [], [], [], [])
+        for split, take_home in zip(splits, take_homes, strict=True):
+            values = self._split_final_values(
+                years,
+                split,
+                take_home,
+                annual_contribution,
+                employer_match,
+                retirement_tax_rate,
+                initial_401k_balance,
+                initial_taxable_balance,
+                mega_backdoor_contribution,
+            )
+            for column, value in zip(columns, values):
+                column.append(round(value, 2))
+
+        return dict(
+            zip(
+                ("traditional_balance", "roth_balance", "taxable_balance", "mega_backdoor_balance", "after_tax_total"),
+                columns,
             )
-            if result.after_tax_total > best_value:
-                best_value = result.after_tax_total
-                best_split = split
+        )
+
+    def _split_final_values(
+        self,
+        years: int,
+        split: float,
+        take_home: float,
+        annual_contribution: float,
+        employer_match: float,
+        retirement_tax_rate: float,
+        initial_401k_balance: float,
+        initial_taxable_balance: float,
+        mega_backdoor_contribution: float,
+    ) -> tuple[float, float, float, float, float]:
+        """Unrounded (traditional, roth, taxable, mega backdoor, after-tax total) at retirement."""
+        split_ratio = split / 100
+        growth_factor = self._growth_factor
+        contribution_factor = self._contribution_factor
+
+        actual_mega_backdoor = min(mega_backdoor_contribution, take_home)
+        annual_taxable_savings = max(0, (take_home - actual_mega_backdoor) * self.savings_rate)
 
-        return best_split, best_value
+        traditional_balance = _compound_final(
+            initial_401k_balance * split_ratio,
+            (annual_contribution * split_ratio + employer_match) * contribution_factor,
+            growth_factor,
+            years,
+        )
+        roth_balance = _compound_final(
+            initial_401k_balance * (1 - split_ratio),
+            annual_contribution * (1 - split_ratio) * contribution_factor,
+            growth_factor,
+            years,
+        )
+        mega_backdoor_balance = _compound_final(
+            0.0, actual_mega_backdoor * contribution_factor, growth_factor, years
+        )
+        taxable_balance = _compound_final(
+            initial_taxable_balance,
+            annual_taxable_savings * self._taxable_contribution_factor,
+            self._taxable_growth_factor,
+            years,
+        )
+
+        taxable_gains = taxable_balance - initial_taxable_balance - annual_taxable_savings * years
+        total_after_tax = (
+            traditional_balance * (1 - retirement_tax_rate)
+            + roth_balance
+            + taxable_balance - taxable_gains * self.capital_gains_rate
+            + mega_backdoor_balance
+        )
+        return traditional_balance, roth_balance, taxable_balance, mega_backdoor_balance, total_after_tax
+
+
+def _is_concave(values: Sequence[float], rel_tolerance: float = 1e-12) -> bool:
+    """True if second differences are non-positive, up to floating-point noise.
+
+    Take-homes are unrounded, so the only slack needed is a few ulps of the
+    largest value; anything bigger would let convex inputs into the search.
+    """
+    tolerance = rel_tolerance * max(map(abs, values), default=0.0)
+    return all(
+        values[i - 1] - 2 * values[i] + values[i + 1] <= tolerance
+        for i in range(1, len(values) - 1)
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _calculate_projections_cached(
+    annual_return: float,
+    taxable_return: float,
+    contribution_timing: str,
+    capital_gains_rate: float,
+    savings_rate: float,
+    dividend_yield: float,
+    current_age: int,
+    retirement_age: int,
+    annual_contribution: float,
+    employer_match: float,
+    retirement_tax_rate: float,
+    trad_take_home: float,
+    roth_take_home: float,
+    initial_401k_balance: float,
+    initial_taxable_balance: float,
+    mega_backdoor_contribution: float,
+) -> ProjectionResult:
+    calc = ProjectionCalculator(
+        annual_return=annual_return,
+        taxable_return=taxable_return,
+        contribution_timing=contribution_timing,
+        capital_gains_rate=capital_gains_rate,
+        savings_rate=savings_rate,
+        dividend_yield=dividend_yield,
+    )
+    return calc._calculate_projections(
+        current_age,
+        retirement_age,
+        annual_contribution,
+        employer_match,
+        retirement_tax_rate,
+        trad_take_home,
+        roth_take_home,
+        initial_401k_balance,
+        initial_taxable_balance,
+        mega_backdoor_contribution,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _find_optimal_split_cached(
+    annual_return: float,
+    taxable_return: float,
+    contribution_timing: str,
+    capital_gains_rate: float,
+    savings_rate: float,
+    dividend_yield: float,
+    current_age: int,
+    retirement_age: int,
+    annual_contribution: float,
+    employer_match: float,
+    retirement_tax_rate: float,
+    take_homes: tuple[float, ...],
+    initial_401k_balance: float,
+    initial_taxable_balance: float,
+    mega_backdoor_contribution: float,
+) -> tuple[float, float]:
+    calc = ProjectionCalculator(
+        annual_return=annual_return,
+        taxable_return=taxable_return,
+        contribution_timing=contribution_timing,
+        capital_gains_rate=capital_gains_rate,
+        savings_rate=savings_rate,
+        dividend_yield=dividend_yield,
+    )
+    after_tax_totals = {}
+
+    # Compare unrounded values: rounding to cents first creates ties on nearly
+    # flat curves, and the search would then discard the true maximum
+    def after_tax_at(index: int) -> float:
+        if index not in after_tax_totals:
+            after_tax_totals[index] = calc._split_final_values(
+                retirement_age - current_age,
+                SPLIT_GRID[index],
+                take_homes[index],
+                annual_contribution,
+                employer_match,
+                retirement_tax_rate,
+                initial_401k_balance,
+                initial_taxable_balance,
+                mega_backdoor_contribution,
+            )[-1]
+        return after_tax_totals[index]
+
+    lo, hi = 0, len(SPLIT_GRID) - 1
+    # After-tax value is linear in the split plus an increasing linear function
+    # of take-home pay, so it is concave (unimodal) whenever take-home is concave
+    # in the split and never dips below the mega backdoor contribution (the cap
+    # and the max(0, ...) on savings are then inactive). Take-home is concave
+    # when it comes from progressive brackets; other inputs get the full sweep.
+    if min(take_homes) >= mega_backdoor_contribution and _is_concave(take_homes):
+        # Ternary search for the leftmost maximum, as the sweep below would pick
+        while hi - lo > 2:
+            third = (hi - lo) // 3
+            if after_tax_at(lo + third) < after_tax_at(hi - third):
+                lo = lo + third + 1
+            else:
+                hi = hi - third - 1
+
+    best_split = 0
+    best_value = 0
+    for index in range(lo, hi + 1):
+        if after_tax_at(index) > best_value:
+            best_value = after_tax_at(index)
+            best_split = SPLIT_GRID[index]
+
+    return best_split, round(best_value, 2)
@@ -1,3 +1,6 @@
+import functools
+from bisect import bisect_left
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Literal
 
@@ -57,8 +60,15 @@ STATE_TAX_RATES = {
     "DC": 0.085,  # Washington D.C.
 }
 
+# Upper- and lowercase codes, so the common cases skip the .upper() allocation
+_STATE_RATES = {**STATE_TAX_RATES, **{code.lower(): rate for code, rate in STATE_TAX_RATES.items()}}
+
+
 def get_state_tax_rate(state_code: str) -> float:
     """Get the state tax rate for a given state code."""
+    rate = _STATE_RATES.get(state_code)
+    if rate is not None:
+        return rate
     return STATE_TAX_RATES.get(state_code.upper(), 0.05)  # Default 5% if unknown
 
 # FICA (Social Security + Medicare) limits for 2024
@@ -72,29 +82,43 @@ FICA_2024 = {
 }
 
 
-def calculate_fica_tax(gross_wages: float, filing_status: str = "single") -> float:
+# Flattened FICA constants so the hot path skips the dict lookups
+_SS_RATE = FICA_2024["social_security_rate"]
+_SS_WAGE_BASE = FICA_2024["social_security_wage_base"]
+_MEDICARE_RATE = FICA_2024["medicare_rate"]
+_ADDL_MEDICARE_RATE = FICA_2024["additional_medicare_rate"]
+_ADDL_MEDICARE_THRESHOLD_SINGLE = FICA_2024["additional_medicare_threshold_single"]
+_ADDL_MEDICARE_THRESHOLD_MFJ = FICA_2024["additional_medicare_threshold_mfj"]
+
+
+# Pure function of its arguments and module constants, so safe to memoize;
+# gross wages repeat across every split evaluated for a single request
+@functools.lru_cache(maxsize=256)
+def calculate_fica_tax(
+    gross_wages: float, filing_status: Literal["single", "married_filing_jointly"] = "single"
+) -> float:
     """Calculate FICA taxes (Social Security + Medicare) on gross wages.
 
     Note: FICA is calculated on gross wages, NOT reduced by 401(k) contributions.
     """
     # Social Security: 6.2% up to wage base
-    ss_wages = min(gross_wages, FICA_2024["social_security_wage_base"])
-    social_security_tax = ss_wages * FICA_2024["social_security_rate"]
+    ss_wages = min(gross_wages, _SS_WAGE_BASE)
+    social_security_tax = ss_wages * _SS_RATE
 
     # Medicare: 1.45% on all wages
-    medicare_tax = gross_wages * FICA_2024["medicare_rate"]
+    medicare_tax = gross_wages * _MEDICARE_RATE
 
     # Additional Medicare: 0.9% on wages over threshold
-    threshold = (FICA_2024["additional_medicare_threshold_mfj"]
+    threshold = (_ADDL_MEDICARE_THRESHOLD_MFJ
                  if filing_status == "married_filing_jointly"
-                 else FICA_2024["additional_medicare_threshold_single"])
+                 else _ADDL_MEDICARE_THRESHOLD_SINGLE)
     if gross_wages > threshold:
-        medicare_tax += (gross_wages - threshold) * FICA_2024["additional_medicare_rate"]
+        medicare_tax += (gross_wages - threshold) * _ADDL_MEDICARE_RATE
 
     return round(social_security_tax + medicare_tax, 2)
 
 
-TAX_BRACKETS_2024 = {
+TAX_BRACKETS_2024: dict[str, list[tuple[float, float]]] = {
     "single": [
         (11600, 0.10),
         (47150, 0.12),
@@ -116,7 +140,31 @@ TAX_BRACKETS_2024 = {
 }
 
 
-@dataclass
+def _build_bracket_table(
+    brackets: list[tuple[float, float]],
+) -> tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...], tuple[float, ...]]:
+    """Parallel tables for a direct bracket lookup.
+
+    Returns the upper bounds to bisect and, for each bracket, its rate, its
+    lower bound and the tax owed on all income below it.
+    """
+    uppers = tuple(bracket_max for bracket_max, _ in brackets)
+    rates = tuple(rate for _, rate in brackets)
+    starts = [0]
+    cumulative_tax = [0]
+    for bracket_max, rate in brackets[:-1]:
+        cumulative_tax.append(cumulative_tax[-1] + (bracket_max - starts[-1]) * rate)
+        starts.append(bracket_max)
+    return uppers, rates, tuple(starts), tuple(cumulative_tax)
+
+
+_BRACKET_TABLES = {
+    filing_status: _build_bracket_table(brackets)
+    for filing_status, brackets in TAX_BRACKETS_2024.items()
+}
+
+
+@dataclass(slots=True, frozen=True)
 class TaxResult:
     taxable_income: float
     federal_tax: float
@@ -127,7 +175,7 @@ class TaxResult:
     marginal_rate: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaxComparisonResult:
     current_traditional: TaxResult
     current_roth: TaxResult
@@ -143,12 +191,17 @@ class TaxCalculator:
         filing_status: Literal["single", "married_filing_jointly"] = "single",
         year: int = 2024,
         state_tax_rate: float = 0.0,  # State tax rate as decimal (e.g., 0.05 for 5%)
-    ):
+    ) -> None:
         self.filing_status = filing_status
         self.brackets = TAX_BRACKETS_2024[filing_status]
         self.state_tax_rate = state_tax_rate
+        self._has_state_tax = state_tax_rate != 0.0
+
+        self._uppers, self._rates, self._starts, self._cumulative_tax = _BRACKET_TABLES[filing_status]
+        # Combined federal + state marginal rate per bracket (excludes FICA)
+        self._marginal_rates = tuple(rate + state_tax_rate for rate in self._rates)
 
-    def calculate_tax(self, taxable_income: float, gross_wages: float = None, include_fica: bool = True) -> TaxResult:
+    def calculate_tax(self, taxable_income: float, gross_wages: float | None = None, include_fica: bool = True) -> TaxResult:
         """Calculate taxes on income.
 
         Args:
@@ -166,41 +219,60 @@ class TaxCalculator:
                 total_tax=fica_tax, effective_rate=0, marginal_rate=0.10
             )
 
-        federal_tax = 0
-        previous_bracket = 0
-        marginal_rate = 0.10
-
-        for bracket_max, rate in self.brackets:
-            if taxable_income <= bracket_max:
-                federal_tax += (taxable_income - previous_bracket) * rate
-                marginal_rate = rate
-                break
-            else:
-                federal_tax += (bracket_max - previous_bracket) * rate
-                previous_bracket = bracket_max
-                marginal_rate = rate
+        # First bracket whose upper bound is >= taxable_income
+        i = bisect_left(self._uppers, taxable_income)
+        federal_tax = self._cumulative_tax[i] + (taxable_income - self._starts[i]) * self._rates[i]
 
         # State tax (simplified flat rate)
-        state_tax = taxable_income * self.state_tax_rate
+        state_tax = taxable_income * self.state_tax_rate if self._has_state_tax else 0.0
 
         # FICA tax (on gross wages, not reduced by 401k)
         # Only include for wage income, not retirement income
-        fica_tax = calculate_fica_tax(gross_wages, self.filing_status) if include_fica else 0
+        fica_tax = calculate_fica_tax(gross_wages, self.filing_status) if (include_fica and gross_wages > 0) else 0
 
         total_tax = federal_tax + state_tax + fica_tax
 
         effective_rate = total_tax / taxable_income if taxable_income > 0 else 0
 
+        # Unrounded; the API rounds at the response boundary
         return TaxResult(
-            taxable_income=round(taxable_income, 2),
-            federal_tax=round(federal_tax, 2),
-            state_tax=round(state_tax, 2),
-            fica_tax=round(fica_tax, 2),
-            total_tax=round(total_tax, 2),
-            effective_rate=round(effective_rate, 4),
-            marginal_rate=marginal_rate + self.state_tax_rate,  # Combined marginal rate (excludes FICA)
+            taxable_income=taxable_income,
+            federal_tax=federal_tax,
+            state_tax=state_tax,
+            fica_tax=fica_tax,
+            total_tax=total_tax,
+            effective_rate=effective_rate,
+            marginal_rate=self._marginal_rates[i],  # Combined marginal rate (excludes FICA)
         )
 
+    def calculate_total_tax_many(
+        self, taxable_incomes: Sequence[float], gross_wages: float
+    ) -> list[float]:
+        """Total tax (federal + state + FICA) for several taxable incomes at once.
+
+        Equivalent to ``calculate_tax(income, gross_wages).total_tax`` for each
+        income, but FICA and the bound lookups are hoisted out of the loop so a
+        full split sweep is a single pass.
+        """
+        fica_tax = calculate_fica_tax(gross_wages, self.filing_status) if gross_wages > 0 else 0
+        uppers = self._uppers
+        rates = self._rates
+        starts = self._starts
+        cumulative_tax = self._cumulative_tax
+        state_tax_rate = self.state_tax_rate
+        has_state_tax = self._has_state_tax
+
+        totals = []
+        for taxable_income in taxable_incomes:
+            if taxable_income <= 0:
+                totals.append(fica_tax)
+                continue
+            i = bisect_left(uppers, taxable_income)
+            federal_tax = cumulative_tax[i] + (taxable_income - starts[i]) * rates[i]
+            state_tax = taxable_income * state_tax_rate if has_state_tax else 0.0
+            totals.append(federal_tax + state_tax + fica_tax)
+        return totals
+
     def compare_tax_impact(
         self,
         current_income: float,
@@ -213,8 +285,8 @@ class TaxCalculator:
 
         current_year_savings = current_roth.total_tax - current_traditional.total_tax
 
-        retirement_traditional = self.calculate_tax(retirement_income)
-        retirement_roth = self.calculate_tax(retirement_income)
+        # Both plans draw the same retirement income, so they share one result
+        retirement_traditional = retirement_roth = self.calculate_tax(retirement_income)
 
         if traditional_contribution > 0:
             break_even = current_traditional.marginal_rate
@@ -251,31 +323,18 @@ class TaxCalculator:
 
         # Find which bracket boundary we should target
         # We want Traditional to reduce income down to where marginal rate <= retirement rate
-        target_taxable = taxable_income
-        current_marginal = self.calculate_tax(taxable_income).marginal_rate
-
-        previous_bracket = 0
-        for bracket_max, rate in self.brackets:
-            if rate <= retirement_tax_rate:
-                # This bracket's rate is at or below retirement rate
-                # Don't use Traditional to reduce income in this bracket
-                if taxable_income > bracket_max:
-                    previous_bracket = bracket_max
-                    continue
-                else:
-                    # Current income is in a bracket at/below retirement rate
-                    # Don't use Traditional at all for this income
-                    target_taxable = taxable_income  # No reduction needed
-                    break
-            else:
-                # This bracket's rate is higher than retirement rate
-                # We SHOULD use Traditional for income in this bracket
-                if taxable_income <= bracket_max:
-                    # We're in this bracket - target the bottom of it
-                    target_taxable = previous_bracket
-                    break
-                else:
-                    previous_bracket = bracket_max
+        i = bisect_left(self._uppers, taxable_income)
+        bracket_rate = self._rates[i]
+        current_marginal = self._marginal_rates[i] if taxable_income > 0 else 0.10
+
+        if bracket_rate <= retirement_tax_rate:
+            # Current income is in a bracket at/below retirement rate
+            # Don't use Traditional at all for this income
+            target_taxable = taxable_income
+        else:
+            # This bracket's rate is higher than retirement rate
+            # Target the bottom of it
+            target_taxable = self._starts[i]
 
         # Calculate how much Traditional contribution needed
         optimal_traditional = taxable_income - target_taxable
@@ -290,3 +349,16 @@ class TaxCalculator:
             explanation = f"Use {pct:.0f}% Traditional (${optimal_traditional:,.0f}) to reduce {current_marginal*100:.0f}% bracket income, rest as Roth"
 
         return optimal_traditional, explanation
+
+
+@functools.lru_cache(maxsize=128)
+def get_tax_calculator(
+    filing_status: Literal["single", "married_filing_jointly"] = "single",
+    state_tax_rate: float = 0.0,
+) -> TaxCalculator:
+    """Shared TaxCalculator for a filing status and state rate.
+
+    Calculators are never mutated after construction, so requests with the
+    same inputs can reuse one instance and its precomputed bracket tables.
+    """
+    return TaxCalculator(filing_status=filing_status, state_tax_rate=state_tax_rate)
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pathlib import Path
 
 from .models import (
@@ -13,20 +13,59 @@ from .models import (
     YearlyProjectionResponse,
     LimitsResponse,
 )
-from .calculators import ContributionCalculator, TaxCalculator, ProjectionCalculator
-from .calculators.tax import get_state_tax_rate
+from .calculators import ContributionCalculator, ProjectionCalculator
+from .calculators.tax import STATE_TAX_RATES, TaxResult, get_tax_calculator
 from .calculators.contributions import CONTRIBUTION_LIMITS
+from .calculators.projections import SPLIT_FRACTIONS, ProjectionSeries
 
 app = FastAPI(
     title="Retirement Plan Comparison",
     description="Compare Traditional 401(k) vs Roth 401(k)",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 static_path = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=static_path), name="static")
 
 
+def _yearly_projection_responses(series: ProjectionSeries) -> list[YearlyProjectionResponse]:
+    return [
+        YearlyProjectionResponse.model_construct(
+            year=year,
+            age=age,
+            contribution=contribution,
+            employer_match=employer_match,
+            growth=round(growth, 2),
+            balance=round(balance, 2),
+            total_wealth=round(total_wealth, 2),
+            after_tax_wealth=round(after_tax_wealth, 2),
+        )
+        for year, age, contribution, employer_match, growth, balance, total_wealth, after_tax_wealth in zip(
+            series.year,
+            series.age,
+            series.contribution,
+            series.employer_match,
+            series.growth,
+            series.balance,
+            series.total_wealth,
+            series.after_tax_wealth,
+        )
+    ]
+
+
+def _tax_result_response(result: TaxResult) -> TaxResultResponse:
+    return TaxResultResponse.model_construct(
+        taxable_income=round(result.taxable_income, 2),
+        federal_tax=round(result.federal_tax, 2),
+        state_tax=round(result.state_tax, 2),
+        fica_tax=round(result.fica_tax, 2),
+        total_tax=round(result.total_tax, 2),
+        effective_rate=round(result.effective_rate, 4),
+        marginal_rate=result.marginal_rate,
+    )
+
+
 @app.get("/")
 async def root():
     return FileResponse(static_path / "index.html")
@@ -65,28 +104,19 @@ async def compare_plans(request: ComparisonRequest):
     )
 
     # Create tax calculators for current and retirement (may have different state tax rates)
-    current_state_rate = get_state_tax_rate(request.current_state)
-    retirement_state_rate = get_state_tax_rate(request.retirement_state)
+    current_state_rate = STATE_TAX_RATES[request.current_state]
+    retirement_state_rate = STATE_TAX_RATES[request.retirement_state]
 
-    current_tax_calc = TaxCalculator(
+    current_tax_calc = get_tax_calculator(
         filing_status=request.filing_status,
         state_tax_rate=current_state_rate,
     )
-    retirement_tax_calc = TaxCalculator(
+    retirement_tax_calc = get_tax_calculator(
         filing_status=request.filing_status,
         state_tax_rate=retirement_state_rate,
     )
     total_income = request.annual_income + request.annual_bonus
 
-    # Function to calculate take-home for a given Traditional split
-    def get_take_home_for_split(split_percent: float) -> float:
-        traditional_contrib = contribution.employee_contribution * (split_percent / 100)
-        tax_result = current_tax_calc.calculate_tax(
-            total_income - traditional_contrib,
-            gross_wages=total_income  # FICA based on gross
-        )
-        return total_income - contribution.employee_contribution - tax_result.total_tax
-
     # Calculate current year taxes (using current state rate)
     current_traditional_tax = current_tax_calc.calculate_tax(
         total_income - contribution.employee_contribution,
@@ -95,20 +125,33 @@ async def compare_plans(request: ComparisonRequest):
     current_roth_tax = current_tax_calc.calculate_tax(total_income, gross_wages=total_income)
     current_year_savings = current_roth_tax.total_tax - current_traditional_tax.total_tax
 
+    # Take-home for every candidate split in SPLIT_FRACTIONS plus the user's
+    # own split, in one batched tax pass
+    employee_contribution = contribution.employee_contribution
+    current_split = request.traditional_split
+    split_taxes = current_tax_calc.calculate_total_tax_many(
+        [
+            total_income - employee_contribution * fraction
+            for fraction in (*SPLIT_FRACTIONS, current_split / 100)
+        ],
+        gross_wages=total_income,  # FICA based on gross
+    )
+    split_take_homes = [total_income - employee_contribution - tax for tax in split_taxes]
+    take_homes = tuple(split_take_homes[:-1])
+    current_take_home = split_take_homes[-1]
+
+    # The grid runs from 0% (all Roth) to 100% (all Traditional)
+    roth_take_home = take_homes[0]
+    trad_take_home = take_homes[-1]
+
     # Calculate retirement taxes (using retirement state rate)
     # No FICA on retirement income (401k withdrawals are not wages)
     retirement_tax = retirement_tax_calc.calculate_tax(
         request.expected_retirement_income,
         include_fica=False
     )
-
-    # Calculate take-home for the actual split
-    current_split = request.traditional_split
-    current_take_home = get_take_home_for_split(current_split)
-
-    # Also calculate 100% Traditional and 100% Roth for comparison
-    trad_take_home = get_take_home_for_split(100)
-    roth_take_home = get_take_home_for_split(0)
+    # Projections use the same 4-decimal effective rate the response reports
+    retirement_tax_rate = round(retirement_tax.effective_rate, 4)
 
     proj_calc = ProjectionCalculator(
         annual_return=request.expected_return / 100,
@@ -124,7 +167,7 @@ async def compare_plans(request: ComparisonRequest):
         retirement_age=request.retirement_age,
         annual_contribution=contribution.employee_contribution,
         employer_match=contribution.employer_match,
-        retirement_tax_rate=retirement_tax.effective_rate,
+        retirement_tax_rate=retirement_tax_rate,
         take_home=trad_take_home,
         initial_401k_balance=request.initial_401k_balance,
         initial_taxable_balance=request.initial_taxable_balance,
@@ -136,7 +179,7 @@ async def compare_plans(request: ComparisonRequest):
         retirement_age=request.retirement_age,
         annual_contribution=contribution.employee_contribution,
         employer_match=contribution.employer_match,
-        retirement_tax_rate=retirement_tax.effective_rate,
+        retirement_tax_rate=retirement_tax_rate,
         take_home=roth_take_home,
         initial_401k_balance=request.initial_401k_balance,
         initial_taxable_balance=request.initial_taxable_balance,
@@ -144,14 +187,14 @@ async def compare_plans(request: ComparisonRequest):
         traditional_split=0,
     )
 
-    # Find optimal split (brute force)
+    # Find optimal split (brute force over the grid)
     optimal_split, optimal_after_tax = proj_calc.find_optimal_split(
         current_age=request.current_age,
         retirement_age=request.retirement_age,
         annual_contribution=contribution.employee_contribution,
         employer_match=contribution.employer_match,
-        retirement_tax_rate=retirement_tax.effective_rate,
-        take_home_at_split=get_take_home_for_split,
+        retirement_tax_rate=retirement_tax_rate,
+        take_homes=take_homes,
         initial_401k_balance=request.initial_401k_balance,
         initial_taxable_balance=request.initial_taxable_balance,
         mega_backdoor_contribution=request.mega_backdoor_contribution,
@@ -161,26 +204,33 @@ async def compare_plans(request: ComparisonRequest):
     bracket_optimal_amount, bracket_explanation = current_tax_calc.calculate_optimal_traditional(
         current_income=total_income,
         max_contribution=contribution.employee_contribution,
-        retirement_tax_rate=retirement_tax.effective_rate,
+        retirement_tax_rate=retirement_tax_rate,
     )
-    bracket_optimal_split = round(
-        (bracket_optimal_amount / contribution.employee_contribution) * 100
-    ) if contribution.employee_contribution > 0 else 0
-
-    # Calculate projection for the user's selected split
-    split_projection = proj_calc.calculate_split_projection(
-        current_age=request.current_age,
-        retirement_age=request.retirement_age,
-        annual_contribution=contribution.employee_contribution,
-        employer_match=contribution.employer_match,
-        retirement_tax_rate=retirement_tax.effective_rate,
-        take_home=current_take_home,
-        initial_401k_balance=request.initial_401k_balance,
-        initial_taxable_balance=request.initial_taxable_balance,
-        mega_backdoor_contribution=request.mega_backdoor_contribution,
-        traditional_split=current_split,
+    # Whole-percent split, like the user-facing traditional_split input
+    bracket_optimal_split = (
+        round(100 * bracket_optimal_amount / employee_contribution) if employee_contribution > 0 else 0
     )
 
+    # Calculate projection for the user's selected split; the all-Traditional
+    # and all-Roth cases were already projected above
+    if current_split == 100:
+        split_projection = trad_100_projection
+    elif current_split == 0:
+        split_projection = roth_100_projection
+    else:
+        split_projection = proj_calc.calculate_split_projection(
+            current_age=request.current_age,
+            retirement_age=request.retirement_age,
+            annual_contribution=contribution.employee_contribution,
+            employer_match=contribution.employer_match,
+            retirement_tax_rate=retirement_tax_rate,
+            take_home=current_take_home,
+            initial_401k_balance=request.initial_401k_balance,
+            initial_taxable_balance=request.initial_taxable_balance,
+            mega_backdoor_contribution=request.mega_backdoor_contribution,
+            traditional_split=current_split,
+        )
+
     if roth_100_projection.after_tax_total > trad_100_projection.after_tax_total:
         advantage = "Roth 401(k)"
         advantage_amount = roth_100_projection.after_tax_total - trad_100_projection.after_tax_total
@@ -188,38 +238,24 @@ async def compare_plans(request: ComparisonRequest):
         advantage = "Traditional 401(k)"
         advantage_amount = trad_100_projection.after_tax_total - roth_100_projection.after_tax_total
 
-    return ComparisonResponse(
-        contribution=ContributionResponse(
+    # Every field comes from our own calculators, so skip per-model validation;
+    # FastAPI still checks the whole response against response_model
+    return ComparisonResponse.model_construct(
+        contribution=ContributionResponse.model_construct(
             employee_contribution=contribution.employee_contribution,
             employer_match=contribution.employer_match,
             total_contribution=contribution.total_contribution,
             max_employee_allowed=contribution.max_employee_allowed,
             is_over_limit=contribution.is_over_limit,
         ),
-        tax_comparison=TaxComparisonResponse(
-            current_traditional=TaxResultResponse(
-                taxable_income=current_traditional_tax.taxable_income,
-                federal_tax=current_traditional_tax.federal_tax,
-                state_tax=current_traditional_tax.state_tax,
-                fica_tax=current_traditional_tax.fica_tax,
-                total_tax=current_traditional_tax.total_tax,
-                effective_rate=current_traditional_tax.effective_rate,
-                marginal_rate=current_traditional_tax.marginal_rate,
-            ),
-            current_roth=TaxResultResponse(
-                taxable_income=current_roth_tax.taxable_income,
-                federal_tax=current_roth_tax.federal_tax,
-                state_tax=current_roth_tax.state_tax,
-                fica_tax=current_roth_tax.fica_tax,
-                total_tax=current_roth_tax.total_tax,
-                effective_rate=current_roth_tax.effective_rate,
-                marginal_rate=current_roth_tax.marginal_rate,
-            ),
-            current_year_tax_savings=current_year_savings,
-            retirement_tax_rate=retirement_tax.effective_rate,
+        tax_comparison=TaxComparisonResponse.model_construct(
+            current_traditional=_tax_result_response(current_traditional_tax),
+            current_roth=_tax_result_response(current_roth_tax),
+            current_year_tax_savings=round(current_year_savings, 2),
+            retirement_tax_rate=retirement_tax_rate,
             break_even_rate=current_traditional_tax.marginal_rate,  # Break-even is current marginal rate
         ),
-        projection_summary=ProjectionSummaryResponse(
+        projection_summary=ProjectionSummaryResponse.model_construct(
             traditional_final_balance=split_projection.traditional_balance,
             roth_final_balance=split_projection.roth_balance,
             traditional_after_tax=trad_100_projection.after_tax_total,
@@ -242,30 +278,6 @@ async def compare_plans(request: ComparisonRequest):
             bracket_optimal_split=bracket_optimal_split,
             bracket_explanation=bracket_explanation,
         ),
-        traditional_projections=[
-            YearlyProjectionResponse(
-                year=p.year,
-                age=p.age,
-                contribution=p.contribution,
-                employer_match=p.employer_match,
-                growth=p.growth,
-                balance=p.balance,
-                total_wealth=p.total_wealth,
-                after_tax_wealth=p.after_tax_wealth,
-            )
-            for p in trad_100_projection.projections
-        ],
-        roth_projections=[
-            YearlyProjectionResponse(
-                year=p.year,
-                age=p.age,
-                contribution=p.contribution,
-                employer_match=p.employer_match,
-                growth=p.growth,
-                balance=p.balance,
-                total_wealth=p.total_wealth,
-                after_tax_wealth=p.after_tax_wealth,
-            )
-            for p in roth_100_projection.projections
-        ],
+        traditional_projections=_yearly_projection_responses(trad_100_projection.series),
+        roth_projections=_yearly_projection_responses(roth_100_projection.series),
     )
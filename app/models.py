@@ -1,6 +1,15 @@
 from pydantic import BaseModel, Field
 from typing import Literal
 
+# Two-letter codes with a known rate, so lookups need no normalization
+StateCode = Literal[
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI",
+    "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI",
+    "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC",
+    "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT",
+    "VT", "VA", "WA", "WV", "WI", "WY", "DC",
+]
+
 
 class ComparisonRequest(BaseModel):
     current_age: int = Field(default=35, ge=18, le=70)
@@ -21,8 +30,8 @@ class ComparisonRequest(BaseModel):
     taxable_return: float = Field(default=6, ge=0)
     filing_status: Literal["single", "married_filing_jointly"] = "single"
     savings_rate: float = Field(default=20, ge=0, le=100)
-    current_state: str = Field(default="CA")  # Current state code
-    retirement_state: str = Field(default="CA")  # Retirement state code
+    current_state: StateCode = "CA"  # Current state code
+    retirement_state: StateCode = "CA"  # Retirement state code
 
 
 class TaxResultResponse(BaseModel):
@@ -1,5 +1,8 @@
+import itertools
+
 import pytest
-from app.calculators.projections import ProjectionCalculator
+from app.calculators.projections import ProjectionCalculator, SPLIT_GRID
+from app.calculators.tax import TaxCalculator
 
 
 class TestProjectionCalculator:
@@ -33,6 +36,26 @@ class TestProjectionCalculator:
         for i in range(1, len(result.traditional_projections)):
             assert result.traditional_projections[i].balance > result.traditional_projections[i-1].balance
 
+    def test_projections_slice_and_iterate_like_lists(self):
+        calc = ProjectionCalculator(annual_return=0.07)
+        result = calc.calculate_projections(
+            current_age=35,
+            retirement_age=65,
+            annual_contribution=10000,
+            employer_match=3000,
+            retirement_tax_rate=0.15,
+            trad_take_home=75000,
+            roth_take_home=73000,
+        )
+        projections = result.traditional_projections
+        as_list = list(projections)
+        assert len(as_list) == 30
+        assert [p.year for p in projections] == list(range(1, 31))
+        assert projections[0:2] == as_list[0:2]
+        assert [p.age for p in projections[::10]] == [36, 46, 56]
+        assert projections[-1] == as_list[-1]
+        assert projections[-1].age == 65
+
     def test_beginning_of_year_grows_more(self):
         calc_beginning = ProjectionCalculator(annual_return=0.07, contribution_timing="beginning")
         calc_end = ProjectionCalculator(annual_return=0.07, contribution_timing="end")
@@ -99,3 +122,182 @@ class TestProjectionCalculator:
         )
         assert result.total_contributions == 10000 * 30
         assert result.total_employer_match == 3000 * 30
+
+    def test_projections_memoized_across_calculators(self):
+        kwargs = dict(
+            current_age=35,
+            retirement_age=65,
+            annual_contribution=10000,
+            employer_match=3000,
+            retirement_tax_rate=0.15,
+            trad_take_home=75000,
+            roth_take_home=73000,
+        )
+        result = ProjectionCalculator(annual_return=0.07).calculate_projections(**kwargs)
+        assert ProjectionCalculator(annual_return=0.07).calculate_projections(**kwargs) is result
+        other = ProjectionCalculator(annual_return=0.05).calculate_projections(**kwargs)
+        assert other.traditional_final_balance < result.traditional_final_balance
+        # Settings that are not call arguments must still be part of the key
+        end_timing = ProjectionCalculator(annual_return=0.07, contribution_timing="end").calculate_projections(**kwargs)
+        assert end_timing.traditional_final_balance < result.traditional_final_balance
+        more_savings = ProjectionCalculator(annual_return=0.07, savings_rate=0.5).calculate_projections(**kwargs)
+        assert more_savings.traditional_taxable_balance > result.traditional_taxable_balance
+
+    def test_cached_projection_columns_are_immutable(self):
+        result = ProjectionCalculator(annual_return=0.07).calculate_projections(
+            current_age=35,
+            retirement_age=65,
+            annual_contribution=10000,
+            employer_match=3000,
+            retirement_tax_rate=0.15,
+            trad_take_home=75000,
+            roth_take_home=73000,
+        )
+        with pytest.raises(TypeError):
+            result.traditional_series.balance[0] = 0.0
+        with pytest.raises(TypeError):
+            result.roth_series.after_tax_wealth[0] = 1.0
+
+    def test_optimal_split_traditional_when_retirement_untaxed(self):
+        calc = ProjectionCalculator(annual_return=0.07, contribution_timing="end")
+        # More Traditional means more take-home to invest in the taxable account
+        take_homes = tuple(70000 + split * 20 for split in SPLIT_GRID)
+        optimal_split, optimal_after_tax = calc.find_optimal_split(
+            current_age=35,
+            retirement_age=65,
+            annual_contribution=10000,
+            employer_match=3000,
+            retirement_tax_rate=0.0,
+            take_homes=take_homes,
+        )
+        assert optimal_split == 100
+        assert optimal_after_tax > 0
+
+    def test_optimal_split_roth_without_tax_savings(self):
+        calc = ProjectionCalculator(annual_return=0.07, contribution_timing="monthly")
+        take_homes = tuple(70000 for _ in SPLIT_GRID)
+        optimal_split, _ = calc.find_optimal_split(
+            current_age=35,
+            retirement_age=65,
+            annual_contribution=10000,
+            employer_match=3000,
+            retirement_tax_rate=0.2,
+            take_homes=take_homes,
+        )
+        assert optimal_split == 0
+
+    def test_split_projection_yearly_access(self):
+        calc = ProjectionCalculator(annual_return=0.07)
+        result = calc.calculate_split_projection(
+            current_age=35,
+            retirement_age=65,
+            annual_contribution=10000,
+            employer_match=3000,
+            retirement_tax_rate=0.15,
+            take_home=74000,
+            traditional_split=40,
+        )
+        assert result.projections is result.projections
+        assert len(result.projections) == 30
+        assert result.projections[-1].traditional_balance == pytest.approx(result.traditional_balance, abs=0.01)
+        assert [p.age for p in result.projections[:3]] == [36, 37, 38]
+
+    def test_split_projection_many_matches_single_split(self):
+        calc = ProjectionCalculator(annual_return=0.07, contribution_timing="monthly")
+        splits = [0, 40, 100]
+        take_homes = [73000, 74000, 75000]
+        batch = calc.calculate_split_projection_many(
+            current_age=35,
+            retirement_age=65,
+            annual_contribution=10000,
+            employer_match=3000,
+            retirement_tax_rate=0.15,
+            splits=splits,
+            take_homes=take_homes,
+            initial_401k_balance=20000,
+            initial_taxable_balance=5000,
+            mega_backdoor_contribution=5000,
+        )
+        for i, (split, take_home) in enumerate(zip(splits, take_homes)):
+            single = calc.calculate_split_projection(
+                current_age=35,
+                retirement_age=65,
+                annual_contribution=10000,
+                employer_match=3000,
+                retirement_tax_rate=0.15,
+                take_home=take_home,
+                initial_401k_balance=20000,
+                initial_taxable_balance=5000,
+                mega_backdoor_contribution=5000,
+                traditional_split=split,
+            )
+            assert batch["traditional_balance"][i] == pytest.approx(single.traditional_balance, abs=0.02)
+            assert batch["roth_balance"][i] == pytest.approx(single.roth_balance, abs=0.02)
+            assert batch["taxable_balance"][i] == pytest.approx(single.taxable_balance, abs=0.02)
+            assert batch["after_tax_total"][i] == pytest.approx(single.after_tax_total, abs=0.02)
+
+    def test_split_projection_many_rejects_mismatched_lengths(self):
+        calc = ProjectionCalculator(annual_return=0.07)
+        with pytest.raises(ValueError):
+            calc.calculate_split_projection_many(
+                current_age=35,
+                retirement_age=65,
+                annual_contribution=10000,
+                employer_match=3000,
+                retirement_tax_rate=0.15,
+                splits=[0, 40, 100],
+                take_homes=[73000, 74000],
+            )
+
+    def test_optimal_split_rejects_take_homes_off_grid(self):
+        calc = ProjectionCalculator(annual_return=0.07)
+        with pytest.raises(ValueError):
+            calc.find_optimal_split(
+                current_age=35,
+                retirement_age=65,
+                annual_contribution=10000,
+                employer_match=3000,
+                retirement_tax_rate=0.15,
+                take_homes=(74000,) * (len(SPLIT_GRID) - 1),
+            )
+
+    def test_optimal_split_search_matches_full_sweep(self):
+        tax_calc = TaxCalculator(filing_status="single", state_tax_rate=0.05)
+        cases = [
+            (
+                ProjectionCalculator(annual_return=0.07, contribution_timing=timing),
+                contribution,
+                retirement_tax_rate,
+                tuple(
+                    income - contribution - tax_calc.calculate_tax(income - contribution * split / 100, gross_wages=income).total_tax
+                    for split in SPLIT_GRID
+                ),
+            )
+            for income, contribution, retirement_tax_rate, timing in itertools.product(
+                [45000, 110000, 210000], [8000, 23000], [0.08, 0.15, 0.25], ["end", "monthly"]
+            )
+        ]
+        # Nearly flat curve: every split is within a cent of break-even, and
+        # comparing rounded values once picked 0% over the true 100% maximum
+        cases.append((
+            ProjectionCalculator(annual_return=0.07, contribution_timing="end", savings_rate=0.2),
+            10000,
+            0.03804456267225431,
+            tuple(63444.86582683668 + 10000 * 0.2600493759841337 * split / 100 for split in SPLIT_GRID),
+        ))
+        for calc, contribution, retirement_tax_rate, take_homes in cases:
+            sweep = [
+                calc._split_final_values(30, split, take_home, contribution, 3000, retirement_tax_rate, 0, 0, 0)[-1]
+                for split, take_home in zip(SPLIT_GRID, take_homes)
+            ]
+            best_value = max(sweep)
+            optimal_split, optimal_after_tax = calc.find_optimal_split(
+                current_age=35,
+                retirement_age=65,
+                annual_contribution=contribution,
+                employer_match=3000,
+                retirement_tax_rate=retirement_tax_rate,
+                take_homes=take_homes,
+            )
+            assert optimal_split == SPLIT_GRID[sweep.index(best_value)]
+            assert optimal_after_tax == round(best_value, 2)
@@ -1,5 +1,8 @@
 import pytest
-from app.calculators.tax import TaxCalculator
+from typing import get_args
+
+from app.calculators.tax import STATE_TAX_RATES, TaxCalculator, get_state_tax_rate, get_tax_calculator
+from app.models import StateCode
 
 
 class TestTaxCalculator:
@@ -40,3 +43,42 @@ class TestTaxCalculator:
         calc = TaxCalculator(filing_status="single")
         result = calc.calculate_tax(300000)
         assert result.marginal_rate == 0.35
+
+    def test_federal_tax_at_bracket_boundaries(self):
+        calc = TaxCalculator(filing_status="single", state_tax_rate=0)
+        assert calc.calculate_tax(11600, include_fica=False).federal_tax == 1160.0
+        assert calc.calculate_tax(11600, include_fica=False).marginal_rate == 0.10
+        assert calc.calculate_tax(11601, include_fica=False).marginal_rate == 0.12
+        assert calc.calculate_tax(47150, include_fica=False).federal_tax == pytest.approx(5426.0)
+
+    def test_total_tax_many_matches_calculate_tax(self):
+        calc = TaxCalculator(filing_status="married_filing_jointly", state_tax_rate=0.05)
+        incomes = [-500, 0, 23200, 50000, 94300.5, 250000, 900000]
+        totals = calc.calculate_total_tax_many(incomes, gross_wages=120000)
+        assert totals == [calc.calculate_tax(income, gross_wages=120000).total_tax for income in incomes]
+
+    def test_state_tax_rate_lookup_is_case_insensitive(self):
+        assert get_state_tax_rate("CA") == 0.093
+        assert get_state_tax_rate("ca") == 0.093
+        assert get_state_tax_rate("Ca") == 0.093
+        assert get_state_tax_rate("ZZ") == 0.05
+
+    def test_state_code_literal_matches_rate_table(self):
+        assert set(get_args(StateCode)) == set(STATE_TAX_RATES)
+
+    def test_get_tax_calculator_reuses_instances(self):
+        calc = get_tax_calculator(filing_status="single", state_tax_rate=0.093)
+        assert calc is get_tax_calculator(filing_status="single", state_tax_rate=0.093)
+        assert calc is not get_tax_calculator(filing_status="married_filing_jointly", state_tax_rate=0.093)
+        assert calc.state_tax_rate == 0.093
+
+    def test_optimal_traditional_targets_bottom_of_high_bracket(self):
+        calc = TaxCalculator(filing_status="single")
+        # $114,600 gross -> $100,000 taxable, in the 22% bracket starting at $47,150
+        amount, _ = calc.calculate_optimal_traditional(114600, 23000, retirement_tax_rate=0.12)
+        assert amount == 23000
+        amount, _ = calc.calculate_optimal_traditional(64600, 23000, retirement_tax_rate=0.12)
+        assert amount == pytest.approx(2850)
+        amount, explanation = calc.calculate_optimal_traditional(114600, 23000, retirement_tax_rate=0.24)
+        assert amount == 0
+        assert "Roth" in explanation